@@ -1,42 +1,92 @@
 from __future__ import annotations
 
-import json
+import atexit
+import functools
+import hashlib
+import hmac
+import itertools
+import os
+import queue
+import shutil
 import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime
+from email.utils import formatdate
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import orjson
 import toml
 from fastapi import FastAPI, File, Header, HTTPException, UploadFile, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-class PublicCommentPayload(BaseModel):
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson; content must already be JSON-native."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Uploaded file names are unique per upload, so their content never changes.
+UPLOAD_CACHE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for uploads: adds far-future cache headers on top of ETag/range handling."""
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        # Uploads are flat: serve single file names only, never nested directories
+        # (the default music dir sits inside the images dir).
+        if os.sep in path or (os.altsep and os.altsep in path):
+            return "", None
+        return super().lookup_path(path)
+
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.update(UPLOAD_CACHE_HEADERS)
+        return response
+
+
+class Payload(BaseModel):
+    """Base for request bodies: validated once on the way in, never mutated afterwards."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class PublicCommentPayload(Payload):
     post_id: int
     content: str
 
 
-class CreatePostPayload(BaseModel):
+class CreatePostPayload(Payload):
     title: str
     summary: Optional[str] = None
     content: str
     images: Optional[List[str]] = None
 
 
-class UpdatePostPayload(BaseModel):
+class UpdatePostPayload(Payload):
     title: Optional[str] = None
     summary: Optional[str] = None
     content: Optional[str] = None
     images: Optional[List[str]] = None
 
 
-class UpdateCommentPayload(BaseModel):
+class UpdateCommentPayload(Payload):
     content: Optional[str] = None
 
 
-class SettingsPayload(BaseModel):
+class SettingsPayload(Payload):
     avatar: Optional[str] = None
     name: Optional[str] = None
     intro: Optional[str] = None
@@ -48,6 +98,7 @@ class SettingsPayload(BaseModel):
     node_color: Optional[str] = None
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     config_path = Path(__file__).parent / "config.toml"
     return toml.load(config_path)
@@ -56,21 +107,346 @@ def load_config() -> Dict[str, Any]:
 def ensure_data_file(path: Path, default: Any) -> None:
     if not path.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(default, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_json(path, default)
+
+
+# Parsed JSON files keyed by path, tagged with the (mtime_ns, size) they were read at.
+# Cached objects are shared between requests: treat them as read-only and hand
+# write_json a new list/dict instead of mutating what read_json returned.
+_JSON_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _normalize_ids(items: List[Any]) -> None:
+    # Legacy files may hold ids as strings; coerce once per load so lookups compare ints directly.
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item["id"] = int(item.get("id", 0))
+        if "post_id" in item:
+            item["post_id"] = int(item["post_id"])
 
 
 def read_json(path: Path) -> Any:
-    ensure_data_file(path, [])
-    return json.loads(path.read_text(encoding="utf-8"))
+    pending = _JSON_PENDING.get(path)
+    if pending is not None:
+        return pending
+    # One stat per read on the hot path; the missing-file case is the rare one.
+    try:
+        stamp = _file_stamp(path)
+    except FileNotFoundError:
+        ensure_data_file(path, [])
+        stamp = _file_stamp(path)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = orjson.loads(path.read_bytes())
+    if isinstance(data, list):
+        _normalize_ids(data)
+    _JSON_CACHE[path] = (stamp, data)
+    return data
 
 
 def write_json(path: Path, data: Any) -> None:
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    previous = _JSON_CACHE.get(path)
+    # Compact output in one buffer, swapped in atomically so readers never see a torn file.
+    # The temp name is per thread so concurrent writers never share (or clobber) one.
+    buf = memoryview(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while buf:
+            buf = buf[os.write(fd, buf) :]
+        # Hot-path appends are coalesced by the write-behind, so every write can afford the fsync.
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+    stamp = _file_stamp(path)
+    _JSON_CACHE[path] = (stamp, data)
+    # Our own write keeps the id sequence valid; carry it over to the new stamp.
+    sequence = _NEXT_ID.get(path)
+    if previous is not None and sequence is not None and sequence[0] == previous[0]:
+        _NEXT_ID[path] = (stamp, sequence[1])
+    # Whatever was staged is superseded: callers build ``data`` from read_json, which saw it.
+    _JSON_PENDING.pop(path, None)
+
+
+# Write-behind for append-heavy files: appends land here and are flushed together
+# after JSON_WRITE_DELAY seconds, instead of rewriting the whole file per request.
+JSON_WRITE_DELAY = 0.5
+_JSON_PENDING: Dict[Path, Any] = {}
+# Held across every read-modify-write of a JSON file (read_json ... write_json), so no
+# writer can build on a list that a concurrent append or flush is about to replace.
+_JSON_WRITE_LOCK = threading.RLock()
+
+
+def _schedule_json_flush(path: Path) -> None:
+    threading.Timer(JSON_WRITE_DELAY, flush_json, (path,)).start()
+
+
+def append_json_record(path: Path, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Give ``record`` the next id, stage it at the end of ``path`` and return it."""
+    with _JSON_WRITE_LOCK:
+        items = read_json(path)
+        record = {"id": allocate_json_id(path, items), **record}
+        if path not in _JSON_PENDING:
+            _schedule_json_flush(path)
+        _JSON_PENDING[path] = [*items, record]
+    return record
+
+
+def flush_json(path: Path) -> None:
+    with _JSON_WRITE_LOCK:
+        data = _JSON_PENDING.get(path)
+        if data is None:
+            return
+        try:
+            write_json(path, data)
+        except BaseException:
+            # Still staged: try again later, since appends only arm a timer for a fresh entry.
+            _schedule_json_flush(path)
+            raise
+
+
+@atexit.register
+def _flush_all_json() -> None:
+    for path in list(_JSON_PENDING):
+        flush_json(path)
+
+
+# id -> record index per JSON list file, tied to the cached list object it was built from.
+_JSON_INDEX: Dict[Path, Tuple[Any, Dict[int, Dict[str, Any]]]] = {}
+
+
+def _read_json_indexed(path: Path) -> Tuple[List[Dict[str, Any]], Dict[int, Dict[str, Any]]]:
+    items = read_json(path)
+    cached = _JSON_INDEX.get(path)
+    if cached is not None and cached[0] is items:
+        return cached
+    # Built back to front so the first record wins on duplicate ids, like a linear scan.
+    index = {item["id"]: item for item in reversed(items)}
+    _JSON_INDEX[path] = (items, index)
+    return items, index
+
+
+# Process-wide source of data versions for ETags; seeded from the clock so a
+# restarted server never reissues a tag an old client may still hold.
+_DATA_VERSIONS = itertools.count(time.time_ns())
+_JSON_VERSION: Dict[Path, Tuple[Any, str]] = {}
+
+
+def read_json_versioned(path: Path) -> Tuple[Any, str]:
+    """Return ``read_json(path)`` with an ETag that changes whenever the data does."""
+    data = read_json(path)
+    cached = _JSON_VERSION.get(path)
+    if cached is not None and cached[0] is data:
+        return cached
+    versioned = (data, f'"{next(_DATA_VERSIONS):x}"')
+    _JSON_VERSION[path] = versioned
+    return versioned
+
+
+def read_json_index(path: Path) -> Dict[int, Dict[str, Any]]:
+    return _read_json_indexed(path)[1]
+
+
+_JSON_GROUPS: Dict[Tuple[Path, str], Tuple[Any, Dict[Any, List[Dict[str, Any]]]]] = {}
+
+
+def read_json_grouped(path: Path, field: str) -> Tuple[Dict[Any, List[Dict[str, Any]]], str]:
+    """Records of ``path`` bucketed by ``field``, with the data's ETag (see read_json_versioned)."""
+    # Rebuilt only when the file changes, so a filtered read costs O(matches)
+    # instead of a scan over every record.
+    items, etag = read_json_versioned(path)
+    cached = _JSON_GROUPS.get((path, field))
+    if cached is not None and cached[0] is items:
+        return cached[1], etag
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for item in items:
+        groups.setdefault(item.get(field), []).append(item)
+    _JSON_GROUPS[(path, field)] = (items, groups)
+    return groups, etag
+
+
+_JSON_NEWEST_FIRST: Dict[Path, Tuple[Any, List[Dict[str, Any]]]] = {}
+
+
+def read_json_newest_first(path: Path) -> Tuple[List[Dict[str, Any]], str]:
+    """Records of ``path`` sorted by id desc, with the data's ETag; sorted once per version."""
+    items, etag = read_json_versioned(path)
+    cached = _JSON_NEWEST_FIRST.get(path)
+    if cached is None or cached[0] is not items:
+        cached = _JSON_NEWEST_FIRST[path] = (items, sorted(items, key=itemgetter("id"), reverse=True))
+    return cached[1], etag
+
+
+def update_json_record(
+    path: Path, record_id: int, changes: Dict[str, Any], omit: Tuple[str, ...] = ()
+) -> Optional[Dict[str, Any]]:
+    """Replace record ``record_id`` with a copy that has ``changes`` applied and ``omit`` keys dropped."""
+    with _JSON_WRITE_LOCK:
+        items, index = _read_json_indexed(path)
+        record = index.get(record_id)
+        if record is None:
+            return None
+        updated = {**record, **changes}
+        for key in omit:
+            updated.pop(key, None)
+        position = items.index(record)
+        write_json(path, [*items[:position], updated, *items[position + 1 :]])
+    return updated
+
+
+def remove_json_record(path: Path, record_id: int) -> bool:
+    with _JSON_WRITE_LOCK:
+        items, index = _read_json_indexed(path)
+        record = index.get(record_id)
+        if record is None:
+            return False
+        # Locate by identity in C and splice, instead of re-filtering every record in Python.
+        position = items.index(record)
+        write_json(path, items[:position] + items[position + 1 :])
+    return True
+
+
+# Next free "id" per JSON list file, valid for the file stamp it was computed at.
+# It is only rebuilt with a full max() scan when the file changed behind our back.
+_NEXT_ID: Dict[Path, Tuple[Tuple[int, int], int]] = {}
+_NEXT_ID_LOCK = threading.Lock()
+
+
+def allocate_json_id(path: Path, items: List[Dict[str, Any]]) -> int:
+    """Reserve the next id for ``items``, which must come from ``read_json(path)``."""
+    with _NEXT_ID_LOCK:
+        stamp = _JSON_CACHE[path][0]
+        sequence = _NEXT_ID.get(path)
+        if sequence is None or sequence[0] != stamp:
+            next_id = max((item["id"] for item in items), default=0) + 1
+        else:
+            next_id = sequence[1]
+        _NEXT_ID[path] = (stamp, next_id + 1)
+        return next_id
+
+
+# WAL gives many concurrent readers plus one writer: reads go to a pool of read-only
+# connections, writes share a single connection, so they queue here instead of
+# spinning on SQLite's busy timeout.
+SQLITE_READER_POOL_SIZE = min(8, os.cpu_count() or 1)
+
+
+def _open_sqlite_connection(db_path: Path, readonly: bool = False) -> sqlite3.Connection:
+    if readonly:
+        conn = sqlite3.connect(
+            f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False, cached_statements=256
+        )
+    else:
+        # Autocommit: single statements commit on their own, multi-statement
+        # work goes through sqlite_transaction().
+        conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+class SQLitePool:
+    def __init__(self, db_path: Path, size: int, readonly: bool = False) -> None:
+        self.db_path = db_path
+        self.readonly = readonly
+        # Empty slots are opened lazily, so an idle server holds no more connections than it used.
+        self._idle: "queue.LifoQueue[Optional[sqlite3.Connection]]" = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._idle.put(None)
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        conn = self._idle.get()
+        try:
+            if conn is None:
+                conn = _open_sqlite_connection(self.db_path, self.readonly)
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+
+_sqlite_pools: Dict[Tuple[Path, bool], SQLitePool] = {}
+_sqlite_pools_lock = threading.Lock()
+
+
+def _get_sqlite_pool(db_path: Path, readonly: bool) -> SQLitePool:
+    pool = _sqlite_pools.get((db_path, readonly))
+    if pool is None:
+        size = SQLITE_READER_POOL_SIZE if readonly else 1
+        with _sqlite_pools_lock:
+            pool = _sqlite_pools.setdefault((db_path, readonly), SQLitePool(db_path, size, readonly))
+    return pool
+
+
+_sqlite_versions: Dict[Path, int] = {}
+
+
+@contextmanager
+def sqlite_session(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """The database's single writer connection; use sqlite_reader() for queries."""
+    with _get_sqlite_pool(db_path, readonly=False).acquire() as conn:
+        changes = conn.total_changes
+        yield conn
+        # Bumped after the write is committed, so a tag read before a query never outruns its data.
+        if conn.total_changes != changes:
+            _sqlite_versions[db_path] = next(_DATA_VERSIONS)
+
+
+@contextmanager
+def sqlite_reader(db_path: Path) -> Iterator[sqlite3.Connection]:
+    with _get_sqlite_pool(db_path, readonly=True).acquire() as conn:
+        yield conn
+
+
+def sqlite_etag(db_path: Path) -> str:
+    version = _sqlite_versions.get(db_path)
+    if version is None:
+        version = _sqlite_versions.setdefault(db_path, next(_DATA_VERSIONS))
+    return f'"{version:x}"'
+
+
+@contextmanager
+def sqlite_transaction(db_path: Path) -> Iterator[sqlite3.Connection]:
+    with sqlite_session(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
 
 def init_sqlite(db_path: Path) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(db_path) as conn:
+    with sqlite_transaction(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                summary TEXT,
+                content TEXT,
+                images_json TEXT,
+                created_at TEXT
+            )
+            """
+        )
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS public_comments (
@@ -83,41 +459,217 @@ def init_sqlite(db_path: Path) -> None:
             )
             """
         )
-        conn.commit()
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_public_comments_post_id ON public_comments(post_id)")
 
 
-def list_public_comments_from_sqlite(db_path: Path, post_id: int) -> List[Dict[str, Any]]:
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
+def _post_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "summary": row["summary"],
+        "content": row["content"],
+        "images": orjson.loads(row["images_json"] or "[]"),
+        "created_at": row["created_at"],
+    }
+
+
+def list_posts_from_sqlite(db_path: Path, page: int, size: int) -> Tuple[List[Dict[str, Any]], int]:
+    with sqlite_reader(db_path) as conn:
+        total = conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
         cursor = conn.execute(
-            "SELECT * FROM public_comments WHERE post_id = ? ORDER BY id DESC",
-            (post_id,),
+            "SELECT * FROM posts ORDER BY id DESC LIMIT ? OFFSET ?",
+            (size, (page - 1) * size),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return [_post_from_row(row) for row in cursor.fetchall()], total
 
 
-def list_all_comments_from_sqlite(db_path: Path) -> List[Dict[str, Any]]:
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute("SELECT * FROM public_comments ORDER BY id DESC")
-        return [dict(row) for row in cursor.fetchall()]
+def get_post_from_sqlite(db_path: Path, post_id: int) -> Optional[Dict[str, Any]]:
+    with sqlite_reader(db_path) as conn:
+        row = conn.execute("SELECT * FROM posts WHERE id = ?", (post_id,)).fetchone()
+        return _post_from_row(row) if row else None
 
 
-def insert_public_comment_to_sqlite(
-    db_path: Path, payload: PublicCommentPayload, post_title: str, post_summary: str
+def insert_post_to_sqlite(
+    db_path: Path, title: str, summary: str, content: str, images: List[str]
 ) -> Dict[str, Any]:
     created_at = _now_local_iso()
-    with sqlite3.connect(db_path) as conn:
+    with sqlite_session(db_path) as conn:
         cursor = conn.execute(
             """
-            INSERT INTO public_comments (post_id, post_title, post_summary, content, created_at)
+            INSERT INTO posts (title, summary, content, images_json, created_at)
             VALUES (?, ?, ?, ?, ?)
             """,
-            (payload.post_id, post_title, post_summary, payload.content, created_at),
+            (title, summary, content, orjson.dumps(images).decode(), created_at),
         )
-        conn.commit()
-        comment_id = cursor.lastrowid
-    return {"id": comment_id, "created_at": created_at}
+        post_id = cursor.lastrowid
+    return {
+        "id": post_id,
+        "title": title,
+        "summary": summary,
+        "content": content,
+        "images": images,
+        "created_at": created_at,
+    }
+
+
+def update_post_in_sqlite(db_path: Path, post_id: int, payload: UpdatePostPayload) -> Optional[Dict[str, Any]]:
+    fields = []
+    values: List[Any] = []
+    if payload.title is not None:
+        fields.append("title = ?")
+        values.append(payload.title)
+    if payload.summary is not None:
+        fields.append("summary = ?")
+        values.append(payload.summary)
+    if payload.content is not None:
+        fields.append("content = ?")
+        values.append(payload.content)
+    if payload.images is not None:
+        fields.append("images_json = ?")
+        values.append(orjson.dumps(payload.images).decode())
+    if not fields:
+        return get_post_from_sqlite(db_path, post_id)
+
+    values.append(post_id)
+    with sqlite_transaction(db_path) as conn:
+        cursor = conn.execute(f"UPDATE posts SET {', '.join(fields)} WHERE id = ?", values)
+        if cursor.rowcount == 0:
+            return None
+        row = conn.execute("SELECT * FROM posts WHERE id = ?", (post_id,)).fetchone()
+        return _post_from_row(row) if row else None
+
+
+def delete_post_in_sqlite(db_path: Path, post_id: int) -> bool:
+    with sqlite_session(db_path) as conn:
+        cursor = conn.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+        return cursor.rowcount > 0
+
+
+# Public comment columns, listed explicitly so legacy fields never reach the API.
+_PUBLIC_COMMENT_COLUMNS = ("id", "post_id", "post_title", "post_summary", "content", "created_at")
+_PUBLIC_COMMENT_SELECT = f"SELECT {', '.join(_PUBLIC_COMMENT_COLUMNS)} FROM public_comments"
+
+# Hot comment statements, kept as constants so every call hits the connection's statement cache.
+_SQL_LIST_PUBLIC_COMMENTS = f"{_PUBLIC_COMMENT_SELECT} WHERE post_id = ? ORDER BY id DESC"
+_SQL_LIST_ALL_COMMENTS = f"{_PUBLIC_COMMENT_SELECT} ORDER BY id DESC"
+_SQL_GET_PUBLIC_COMMENT = f"{_PUBLIC_COMMENT_SELECT} WHERE id = ?"
+_SQL_INSERT_PUBLIC_COMMENT_HEAD = (
+    "INSERT INTO public_comments (post_id, post_title, post_summary, content, created_at) VALUES "
+)
+_SQL_INSERT_PUBLIC_COMMENT = _SQL_INSERT_PUBLIC_COMMENT_HEAD + "(?, ?, ?, ?, ?)"
+_SQL_DELETE_PUBLIC_COMMENT = "DELETE FROM public_comments WHERE id = ?"
+
+
+def _plain_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    # Tuple rows zipped against a fixed column tuple are cheaper than sqlite3.Row -> dict.
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
+def list_public_comments_from_sqlite(db_path: Path, post_id: int) -> List[Dict[str, Any]]:
+    with sqlite_reader(db_path) as conn:
+        cursor = _plain_cursor(conn).execute(_SQL_LIST_PUBLIC_COMMENTS, (post_id,))
+        return [dict(zip(_PUBLIC_COMMENT_COLUMNS, row)) for row in cursor]
+
+
+SQLITE_STREAM_BATCH_SIZE = 256
+
+
+def iter_all_comments_from_sqlite(db_path: Path) -> Iterator[List[Dict[str, Any]]]:
+    # Streams on its own connection so a slow client never pins a pooled one;
+    # under WAL it reads a consistent snapshot while writers carry on. StreamingResponse
+    # may resume the generator on a different worker thread each time, one at a time.
+    conn = _open_sqlite_connection(db_path, readonly=True)
+    try:
+        cursor = _plain_cursor(conn).execute(_SQL_LIST_ALL_COMMENTS)
+        while rows := cursor.fetchmany(SQLITE_STREAM_BATCH_SIZE):
+            yield [dict(zip(_PUBLIC_COMMENT_COLUMNS, row)) for row in rows]
+    finally:
+        conn.close()
+
+
+# Multi-row INSERT ... RETURNING hands back the new ids in the same statement (SQLite 3.35+).
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+# Rows per statement: 5 bound values each stays under the 999-variable limit of older builds.
+_SQLITE_INSERT_CHUNK = 199
+
+
+def insert_public_comments_to_sqlite(
+    db_path: Path, rows: List[Tuple[int, str, str, str]]
+) -> List[Dict[str, Any]]:
+    if not rows:
+        return []
+    created_at = _now_local_iso()
+    params = [(*row, created_at) for row in rows]
+    with sqlite_transaction(db_path) as conn:
+        if _SQLITE_HAS_RETURNING:
+            ids: List[int] = []
+            for start in range(0, len(params), _SQLITE_INSERT_CHUNK):
+                chunk = params[start : start + _SQLITE_INSERT_CHUNK]
+                cursor = conn.execute(
+                    _SQL_INSERT_PUBLIC_COMMENT_HEAD + ", ".join(["(?, ?, ?, ?, ?)"] * len(chunk)) + " RETURNING id",
+                    [value for row in chunk for value in row],
+                )
+                # RETURNING order is unspecified, but rowids are assigned in VALUES order.
+                ids.extend(sorted(row[0] for row in cursor))
+        else:
+            conn.executemany(_SQL_INSERT_PUBLIC_COMMENT, params)
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            # Rowids are handed out sequentially while BEGIN IMMEDIATE holds the write lock.
+            ids = list(range(last_id - len(rows) + 1, last_id + 1))
+    return [{"id": comment_id, "created_at": created_at} for comment_id in ids]
+
+
+SQLITE_WRITE_BATCH_SIZE = 64
+
+
+class SQLiteCommentWriter:
+    """Group-commits concurrent public comment submissions into one transaction."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._pending: "queue.Queue[Tuple[Tuple[int, str, str, str], Future]]" = queue.Queue()
+        threading.Thread(target=self._run, name="sqlite-comment-writer", daemon=True).start()
+
+    def submit(self, row: Tuple[int, str, str, str]) -> Dict[str, Any]:
+        future: Future = Future()
+        self._pending.put((row, future))
+        return future.result()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._pending.get()]
+            # Whatever queued up while the previous batch was committing goes out together.
+            while len(batch) < SQLITE_WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                results = insert_public_comments_to_sqlite(self.db_path, [row for row, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+
+
+_comment_writers: Dict[Path, SQLiteCommentWriter] = {}
+_comment_writers_lock = threading.Lock()
+
+
+def insert_public_comment_to_sqlite(
+    db_path: Path, payload: PublicCommentPayload, post_title: str, post_summary: str
+) -> Dict[str, Any]:
+    writer = _comment_writers.get(db_path)
+    if writer is None:
+        with _comment_writers_lock:
+            writer = _comment_writers.get(db_path)
+            if writer is None:
+                writer = _comment_writers[db_path] = SQLiteCommentWriter(db_path)
+    return writer.submit((payload.post_id, post_title, post_summary, payload.content))
 
 
 def update_comment_in_sqlite(db_path: Path, comment_id: int, payload: UpdateCommentPayload) -> Optional[Dict[str, Any]]:
@@ -130,33 +682,34 @@ def update_comment_in_sqlite(db_path: Path, comment_id: int, payload: UpdateComm
         return None
 
     values.append(comment_id)
-    with sqlite3.connect(db_path) as conn:
+    with sqlite_transaction(db_path) as conn:
         cursor = conn.execute(f"UPDATE public_comments SET {', '.join(fields)} WHERE id = ?", values)
-        conn.commit()
         if cursor.rowcount == 0:
             return None
-        conn.row_factory = sqlite3.Row
-        row = conn.execute("SELECT * FROM public_comments WHERE id = ?", (comment_id,)).fetchone()
-        return dict(row) if row else None
+        row = _plain_cursor(conn).execute(_SQL_GET_PUBLIC_COMMENT, (comment_id,)).fetchone()
+        return dict(zip(_PUBLIC_COMMENT_COLUMNS, row)) if row else None
 
 
 def delete_comment_in_sqlite(db_path: Path, comment_id: int) -> bool:
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.execute("DELETE FROM public_comments WHERE id = ?", (comment_id,))
-        conn.commit()
+    with sqlite_session(db_path) as conn:
+        cursor = conn.execute(_SQL_DELETE_PUBLIC_COMMENT, (comment_id,))
         return cursor.rowcount > 0
 
 
 config = load_config()
 
-server_host = config.get("server", {}).get("host", "127.0.0.1")
-server_port = int(config.get("server", {}).get("port", 8000))
-admin_password = str(config.get("admin", {}).get("password", ""))
+server_config = config.get("server", {})
+admin_config = config.get("admin", {})
+storage_config = config.get("storage", {})
+data_config = config.get("data", {})
 
-storage_type = str(config.get("storage", {}).get("storage_type", "json")).lower()
-sqlite_path = Path(config.get("storage", {}).get("sqlite_path", "data/blog_api.db"))
+server_host = str(server_config.get("host", "127.0.0.1"))
+server_port = int(server_config.get("port", 8000))
+admin_password = str(admin_config.get("password", ""))
+
+storage_type = str(storage_config.get("storage_type", "json")).lower()
+sqlite_path = Path(storage_config.get("sqlite_path", "data/blog_api.db"))
 
-data_config = config.get("data", {})
 comments_file = Path(data_config.get("comments_file") or data_config.get("pending_file", "data/comments.json"))
 posts_file = Path(data_config.get("posts_file", "data/posts.json"))
 settings_file = Path(data_config.get("settings_file", "data/settings.json"))
@@ -172,106 +725,187 @@ if storage_type == "sqlite":
 else:
     ensure_data_file(comments_file, [])
     ensure_data_file(posts_file, [])
-    ensure_data_file(settings_file, {})
+# Settings live in settings.json for both storage types.
+ensure_data_file(settings_file, {})
 
 images_dir.mkdir(parents=True, exist_ok=True)
 uploads_images_dir.mkdir(parents=True, exist_ok=True)
 uploads_music_dir.mkdir(parents=True, exist_ok=True)
 
-app = FastAPI(title="Blog Comment API Sample", version="0.2.0")
+app = FastAPI(title="Blog Comment API Sample", version="0.2.0", default_response_class=ORJSONResponse)
 
 app.mount("/web", StaticFiles(directory=web_root), name="web")
+app.mount("/uploads/images", ImmutableStaticFiles(directory=uploads_images_dir), name="uploads_images")
+app.mount("/uploads/music", ImmutableStaticFiles(directory=uploads_music_dir), name="uploads_music")
+
+
+_admin_password_bytes = admin_password.encode("utf-8")
 
 
 def require_admin_password(x_admin_password: str | None) -> None:
     if not admin_password:
         return
-    if not x_admin_password or x_admin_password != admin_password:
+    # Constant-time compare on bytes. Starlette decodes header bytes as latin-1, so
+    # re-encoding with latin-1 recovers exactly what the client sent (UTF-8 for a
+    # non-ASCII password), which is compared against the configured UTF-8 bytes.
+    if not x_admin_password or not hmac.compare_digest(x_admin_password.encode("latin-1"), _admin_password_bytes):
         raise HTTPException(status_code=401, detail="Invalid admin password")
 
 
+# (unix second, formatted timestamp): the string only changes once a second, so the
+# local-time conversion and isoformat are shared by every request within it.
+_now_iso_cache: Tuple[int, str] = (0, "")
+
+
 def _now_local_iso() -> str:
-    return datetime.now().astimezone().isoformat(timespec="seconds")
+    global _now_iso_cache
+    second = int(time.time())
+    cached = _now_iso_cache
+    if cached[0] == second:
+        return cached[1]
+    value = datetime.fromtimestamp(second).astimezone().isoformat(timespec="seconds")
+    _now_iso_cache = (second, value)
+    return value
+
+
+def _omit(item: Dict[str, Any], key: str) -> Dict[str, Any]:
+    if key not in item:
+        return item
+    return {k: v for k, v in item.items() if k != key}
+
+
+def success_response(data: Any, **extra: Any) -> Response:
+    return ORJSONResponse({"code": 0, "message": "success", "data": data, **extra})
+
+
+def not_found_response() -> Response:
+    return ORJSONResponse({"code": 404, "message": "not found", "data": None})
+
+
+def _stream_success_batches(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    yield b'{"code":0,"message":"success","data":['
+    separator = b""
+    for batch in batches:
+        if not batch:
+            continue
+        # One orjson call and one chunk per batch; the list brackets are sliced off.
+        yield separator + orjson.dumps(batch, option=orjson.OPT_NON_STR_KEYS)[1:-1]
+        separator = b","
+    yield b"]}"
+
+
+def streaming_success_response(batches: Iterator[List[Dict[str, Any]]], etag: Optional[str] = None) -> Response:
+    response = StreamingResponse(_stream_success_batches(batches), media_type="application/json")
+    return with_etag(response, etag) if etag else response
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    # no-cache: clients keep the body but revalidate, so a 304 replaces every repeat poll.
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def not_modified_response(etag: str) -> Response:
+    return with_etag(Response(status_code=304), etag)
+
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
-@app.get("/")
-def serve_public_list():
-    return FileResponse(web_root / "public.html")
+# Upload names are <unix time>_<pid>_<sequence>: unique per process without wall-clock formatting.
+_upload_sequence = itertools.count(1)
+_upload_pid = os.getpid()
 
 
-@app.get("/blog")
-def serve_blog_page():
-    return FileResponse(web_root / "public.html")
+def _new_upload_name(suffix: str) -> str:
+    return f"{int(time.time())}_{_upload_pid}_{next(_upload_sequence)}{suffix}"
 
 
-@app.get("/post/{post_id}")
-def serve_public_detail(post_id: int):
-    return FileResponse(web_root / "public.html")
+def _copy_upload(file: UploadFile, target_path: Path) -> None:
+    with target_path.open("wb") as target:
+        shutil.copyfileobj(file.file, target, UPLOAD_CHUNK_SIZE)
+
+
+async def _save_upload(file: UploadFile, target_path: Path) -> None:
+    # Stream the upload in fixed-size chunks, in one threadpool hop off the event loop.
+    await run_in_threadpool(_copy_upload, file, target_path)
 
 
-@app.get("/admin")
-def serve_admin_page():
-    return FileResponse(web_root / "index.html")
+def _load_html_page(path: Path) -> Tuple[bytes, Dict[str, str]]:
+    # Read once at startup: the pages only change on deploy, which restarts the server.
+    body = path.read_bytes()
+    headers = {
+        "ETag": f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"',
+        "Last-Modified": formatdate(path.stat().st_mtime, usegmt=True),
+        "Cache-Control": "public, max-age=60",
+    }
+    return body, headers
+
 
+_PUBLIC_PAGE = _load_html_page(web_root / "public.html")
+_ADMIN_PAGE = _load_html_page(web_root / "index.html")
 
-@app.get("/uploads/images/{image_name}")
-def serve_upload_image(image_name: str):
-    image_path = uploads_images_dir / image_name
-    if not image_path.exists():
-        raise HTTPException(status_code=404, detail="image not found")
-    return FileResponse(image_path)
 
+def html_page_response(page: Tuple[bytes, Dict[str, str]], if_none_match: Optional[str]) -> Response:
+    body, headers = page
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="text/html; charset=utf-8", headers=headers)
 
-@app.get("/uploads/music/{music_name}")
-def serve_upload_music(music_name: str):
-    music_path = uploads_music_dir / music_name
-    if not music_path.exists():
-        raise HTTPException(status_code=404, detail="music not found")
-    return FileResponse(music_path)
+
+# The public site is a single page: list, blog entry and post deep links all load it.
+# HTML pages, not API endpoints, so they stay out of the OpenAPI schema.
+@app.get("/", include_in_schema=False)
+@app.get("/blog", include_in_schema=False)
+@app.get("/post/{post_id:int}", include_in_schema=False)
+async def serve_public_page(if_none_match: str | None = Header(default=None)) -> Response:
+    return html_page_response(_PUBLIC_PAGE, if_none_match)
+
+
+@app.get("/admin", include_in_schema=False)
+async def serve_admin_page(if_none_match: str | None = Header(default=None)) -> Response:
+    return html_page_response(_ADMIN_PAGE, if_none_match)
 
 
 @app.post("/api/v1/uploads/image")
-def upload_image(file: UploadFile = File(...), x_admin_password: str | None = Header(default=None)):
+async def upload_image(file: UploadFile = File(...), x_admin_password: str | None = Header(default=None)) -> Response:
     require_admin_password(x_admin_password)
     if not file.filename:
         raise HTTPException(status_code=400, detail="filename required")
 
     suffix = Path(file.filename).suffix
-    safe_name = f"{datetime.now().strftime('%Y%m%d%H%M%S%f')}{suffix}"
+    safe_name = _new_upload_name(suffix)
     target_path = uploads_images_dir / safe_name
-    with target_path.open("wb") as target:
-        target.write(file.file.read())
+    await _save_upload(file, target_path)
 
-    return {
-        "code": 0,
-        "message": "success",
-        "data": {
-            "filename": safe_name,
-            "url": f"/uploads/images/{safe_name}",
-        },
-    }
+    return success_response({"filename": safe_name, "url": f"/uploads/images/{safe_name}"})
 
 
 @app.delete("/api/v1/uploads/images/{image_name}")
-def delete_image(image_name: str, x_admin_password: str | None = Header(default=None)):
+def delete_image(image_name: str, x_admin_password: str | None = Header(default=None)) -> Response:
     require_admin_password(x_admin_password)
     # Security check: prevent directory traversal
     if ".." in image_name or "/" in image_name or "\\" in image_name:
         raise HTTPException(status_code=400, detail="Invalid filename")
     
     target_path = uploads_images_dir / image_name
-    if not target_path.exists():
-        return {"code": 404, "message": "not found", "data": None}
-    
     try:
         target_path.unlink()
-        return {"code": 0, "message": "success", "data": {"filename": image_name}}
+        return success_response({"filename": image_name})
+    except FileNotFoundError:
+        return not_found_response()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/v1/uploads/music")
-def upload_music(file: UploadFile = File(...), x_admin_password: str | None = Header(default=None)):
+async def upload_music(file: UploadFile = File(...), x_admin_password: str | None = Header(default=None)) -> Response:
     require_admin_password(x_admin_password)
     if not file.filename:
         raise HTTPException(status_code=400, detail="filename required")
@@ -280,251 +914,263 @@ def upload_music(file: UploadFile = File(...), x_admin_password: str | None = He
     if suffix not in [".mp3", ".wav", ".ogg", ".m4a", ".flac"]:
          raise HTTPException(status_code=400, detail="Only audio files allowed (mp3, wav, ogg, m4a, flac)")
 
-    safe_name = f"{datetime.now().strftime('%Y%m%d%H%M%S%f')}{suffix}"
+    safe_name = _new_upload_name(suffix)
     target_path = uploads_music_dir / safe_name
-    with target_path.open("wb") as target:
-        target.write(file.file.read())
+    await _save_upload(file, target_path)
 
-    return {
-        "code": 0,
-        "message": "success",
-        "data": {
-            "filename": safe_name,
-            "url": f"/uploads/music/{safe_name}",
-        },
-    }
+    return success_response({"filename": safe_name, "url": f"/uploads/music/{safe_name}"})
 
 
 @app.delete("/api/v1/uploads/music/{music_name}")
-def delete_music(music_name: str, x_admin_password: str | None = Header(default=None)):
+def delete_music(music_name: str, x_admin_password: str | None = Header(default=None)) -> Response:
     require_admin_password(x_admin_password)
     if ".." in music_name or "/" in music_name or "\\" in music_name:
         raise HTTPException(status_code=400, detail="Invalid filename")
     
     target_path = uploads_music_dir / music_name
-    if not target_path.exists():
-        return {"code": 404, "message": "not found", "data": None}
-    
     try:
         target_path.unlink()
-        return {"code": 0, "message": "success", "data": {"filename": music_name}}
+        return success_response({"filename": music_name})
+    except FileNotFoundError:
+        return not_found_response()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/v1/settings")
-def get_settings():
-    return {"code": 0, "message": "success", "data": read_json(settings_file)}
+@app.get("/api/v1/settings", response_model=None)
+async def get_settings(if_none_match: str | None = Header(default=None)) -> Response:
+    settings, etag = await run_in_threadpool(read_json_versioned, settings_file)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    return with_etag(success_response(settings), etag)
 
 
 @app.post("/api/v1/settings")
-def update_settings(payload: SettingsPayload, x_admin_password: str | None = Header(default=None)):
+def update_settings(payload: SettingsPayload, x_admin_password: str | None = Header(default=None)) -> Response:
     require_admin_password(x_admin_password)
-    current = read_json(settings_file)
-    if payload.avatar is not None:
-        current["avatar"] = payload.avatar
-    if payload.name is not None:
-        current["name"] = payload.name
-    if payload.intro is not None:
-        current["intro"] = payload.intro
-    if payload.background_image is not None:
-        current["background_image"] = payload.background_image
-    if payload.theme_color is not None:
-        current["theme_color"] = payload.theme_color
-    if payload.enable_snow is not None:
-        current["enable_snow"] = payload.enable_snow
-    if payload.music_url is not None:
-        current["music_url"] = payload.music_url
-    if payload.card_opacity is not None:
-        current["card_opacity"] = payload.card_opacity
-    if payload.node_color is not None:
-        current["node_color"] = payload.node_color
-    write_json(settings_file, current)
-    return {"code": 0, "message": "success", "data": current}
-
-
-@app.get("/api/v1/posts")
-def list_posts(page: int = Query(1, ge=1), size: int = Query(10, ge=1, le=100)):
+    with _JSON_WRITE_LOCK:
+        current = {**read_json(settings_file), **payload.model_dump(exclude_none=True)}
+        write_json(settings_file, current)
+    return success_response(current)
+
+
+@app.get("/api/v1/posts", response_model=None)
+async def list_posts(
+    page: int = Query(1, ge=1), size: int = Query(10, ge=1, le=100), if_none_match: str | None = Header(default=None)
+) -> Response:
     if storage_type == "sqlite":
-        return {"code": 0, "message": "success", "data": [], "total": 0}
-    posts = read_json(posts_file)
-    # Sort by id desc (newest first)
-    posts.sort(key=lambda x: int(x.get("id", 0)), reverse=True)
+        etag = sqlite_etag(sqlite_path)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+        posts, total = await run_in_threadpool(list_posts_from_sqlite, sqlite_path, page, size)
+        return with_etag(success_response(posts, total=total), etag)
+    # Sorted newest first off the event loop, and only once per version of the file.
+    posts, etag = await run_in_threadpool(read_json_newest_first, posts_file)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
 
     total = len(posts)
     start = (page - 1) * size
     end = start + size
-    paginated_posts = posts[start:end]
-
-    for item in paginated_posts:
-        item.pop("author", None)
-    return {"code": 0, "message": "success", "data": paginated_posts, "total": total}
+    paginated_posts = [_omit(item, "author") for item in posts[start:end]]
+    return with_etag(success_response(paginated_posts, total=total), etag)
 
 
 @app.post("/api/v1/posts")
-def create_post(payload: CreatePostPayload, x_admin_password: str | None = Header(default=None)):
+def create_post(payload: CreatePostPayload, x_admin_password: str | None = Header(default=None)) -> Response:
     require_admin_password(x_admin_password)
+    summary = payload.summary or payload.content[:120] + ("..." if len(payload.content) > 120 else "")
     if storage_type == "sqlite":
-        raise HTTPException(status_code=501, detail="sqlite not implemented")
-
-    posts = read_json(posts_file)
-    next_id = (max([int(item.get("id", 0)) for item in posts]) + 1) if posts else 1
-    record = {
-        "id": next_id,
-        "title": payload.title,
-        "summary": payload.summary or payload.content[:120] + ("..." if len(payload.content) > 120 else ""),
-        "content": payload.content,
-        "images": payload.images or [],
-        "created_at": _now_local_iso(),
-    }
-    posts.append(record)
-    write_json(posts_file, posts)
-    return {"code": 0, "message": "success", "data": record}
-
-
-@app.get("/api/v1/posts/{post_id}")
-def get_post(post_id: int):
+        record = insert_post_to_sqlite(sqlite_path, payload.title, summary, payload.content, payload.images or [])
+        return success_response(record)
+
+    with _JSON_WRITE_LOCK:
+        posts = read_json(posts_file)
+        next_id = allocate_json_id(posts_file, posts)
+        record = {
+            "id": next_id,
+            "title": payload.title,
+            "summary": summary,
+            "content": payload.content,
+            "images": payload.images or [],
+            "created_at": _now_local_iso(),
+        }
+        write_json(posts_file, [*posts, record])
+    return success_response(record)
+
+
+@app.get("/api/v1/posts/{post_id}", response_model=None)
+async def get_post(post_id: int) -> Response:
     if storage_type == "sqlite":
-        return {"code": 0, "message": "success", "data": None}
-    posts = read_json(posts_file)
-    for item in posts:
-        if int(item.get("id", 0)) == post_id:
-            item.pop("author", None)
-            return {"code": 0, "message": "success", "data": item}
-    return {"code": 404, "message": "not found", "data": None}
+        post = await run_in_threadpool(get_post_from_sqlite, sqlite_path, post_id)
+        if not post:
+            return not_found_response()
+        return success_response(post)
+    post = (await run_in_threadpool(read_json_index, posts_file)).get(post_id)
+    if post is None:
+        return not_found_response()
+    return success_response(_omit(post, "author"))
 
 
 @app.put("/api/v1/posts/{post_id}")
-def update_post(post_id: int, payload: UpdatePostPayload, x_admin_password: str | None = Header(default=None)):
+def update_post(
+    post_id: int, payload: UpdatePostPayload, x_admin_password: str | None = Header(default=None)
+) -> Response:
     require_admin_password(x_admin_password)
     if storage_type == "sqlite":
-        raise HTTPException(status_code=501, detail="sqlite not implemented")
-
-    posts = read_json(posts_file)
-    for item in posts:
-        if int(item.get("id", 0)) == post_id:
-            if payload.title is not None:
-                item["title"] = payload.title
-            if payload.summary is not None:
-                item["summary"] = payload.summary
-            if payload.content is not None:
-                item["content"] = payload.content
-            if payload.images is not None:
-                item["images"] = payload.images
-            write_json(posts_file, posts)
-            return {"code": 0, "message": "success", "data": item}
-    return {"code": 404, "message": "not found", "data": None}
+        updated = update_post_in_sqlite(sqlite_path, post_id, payload)
+        if not updated:
+            return not_found_response()
+        return success_response(updated)
+
+    updated = update_json_record(posts_file, post_id, payload.model_dump(exclude_none=True))
+    if updated is None:
+        return not_found_response()
+    return success_response(updated)
 
 
 @app.delete("/api/v1/posts/{post_id}")
-def delete_post(post_id: int, x_admin_password: str | None = Header(default=None)):
+def delete_post(post_id: int, x_admin_password: str | None = Header(default=None)) -> Response:
     require_admin_password(x_admin_password)
     if storage_type == "sqlite":
-        raise HTTPException(status_code=501, detail="sqlite not implemented")
+        if not delete_post_in_sqlite(sqlite_path, post_id):
+            return not_found_response()
+        return success_response({"id": post_id})
 
-    posts = read_json(posts_file)
-    remaining = [item for item in posts if int(item.get("id", 0)) != post_id]
-    if len(remaining) == len(posts):
-        return {"code": 404, "message": "not found", "data": None}
-    write_json(posts_file, remaining)
-    return {"code": 0, "message": "success", "data": {"id": post_id}}
+    if not remove_json_record(posts_file, post_id):
+        return not_found_response()
+    return success_response({"id": post_id})
 
 
-@app.get("/api/v1/comments/public")
-def list_public_comments(post_id: int):
+@app.get("/api/v1/comments/public", response_model=None)
+async def list_public_comments(post_id: int, if_none_match: str | None = Header(default=None)) -> Response:
     if storage_type == "sqlite":
-        data = list_public_comments_from_sqlite(sqlite_path, post_id)
-        for item in data:
-            item.pop("visitor_name", None)
-        return {"code": 0, "message": "success", "data": data}
+        etag = sqlite_etag(sqlite_path)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+        data = await run_in_threadpool(list_public_comments_from_sqlite, sqlite_path, post_id)
+        return with_etag(success_response(data), etag)
 
-    comments = read_json(comments_file)
-    data = [item for item in comments if int(item.get("post_id", 0)) == post_id]
-    for item in data:
-        item.pop("visitor_name", None)
-    return {"code": 0, "message": "success", "data": data}
+    groups, etag = await run_in_threadpool(read_json_grouped, comments_file, "post_id")
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    data = [_omit(item, "visitor_name") for item in groups.get(post_id, [])]
+    return with_etag(success_response(data), etag)
 
 
 @app.post("/api/v1/comments/public")
-def submit_public_comment(payload: PublicCommentPayload):
+async def submit_public_comment(payload: PublicCommentPayload) -> Response:
     if storage_type == "sqlite":
-        return {"code": 0, "message": "success", "data": insert_public_comment_to_sqlite(sqlite_path, payload, "", "")}
-
-    posts = read_json(posts_file)
-    post_title = ""
-    post_summary = ""
-    for item in posts:
-        if int(item.get("id", 0)) == payload.post_id:
-            post_title = str(item.get("title", ""))
-            post_summary = str(item.get("summary", ""))
-            break
-
-    comments = read_json(comments_file)
-    next_id = (max([c.get("id", 0) for c in comments]) + 1) if comments else 1
-    comment_record = {
-        "id": next_id,
-        "post_id": payload.post_id,
-        "post_title": post_title,
-        "post_summary": post_summary,
-        "content": payload.content,
-        "created_at": _now_local_iso(),
-    }
-    comments.append(comment_record)
-    write_json(comments_file, comments)
-    return {"code": 0, "message": "success", "data": {"id": next_id, "created_at": comment_record["created_at"]}}
+        post = await run_in_threadpool(get_post_from_sqlite, sqlite_path, payload.post_id)
+        post_title = str(post["title"] or "") if post else ""
+        post_summary = str(post["summary"] or "") if post else ""
+        data = await run_in_threadpool(insert_public_comment_to_sqlite, sqlite_path, payload, post_title, post_summary)
+        return success_response(data)
+
+    post = (await run_in_threadpool(read_json_index, posts_file)).get(payload.post_id)
+    post_title = str(post.get("title", "")) if post else ""
+    post_summary = str(post.get("summary", "")) if post else ""
+
+    comment_record = await run_in_threadpool(
+        append_json_record,
+        comments_file,
+        {
+            "post_id": payload.post_id,
+            "post_title": post_title,
+            "post_summary": post_summary,
+            "content": payload.content,
+            "created_at": _now_local_iso(),
+        },
+    )
+    return success_response({"id": comment_record["id"], "created_at": comment_record["created_at"]})
 
 
-@app.get("/api/v1/comments")
-def list_all_comments(x_admin_password: str | None = Header(default=None)):
+@app.post("/api/v1/comments/public/bulk")
+def submit_public_comments_bulk(
+    payloads: List[PublicCommentPayload], x_admin_password: str | None = Header(default=None)
+) -> Response:
     require_admin_password(x_admin_password)
     if storage_type == "sqlite":
-        data = list_all_comments_from_sqlite(sqlite_path)
-    else:
-        data = read_json(comments_file)
-    for item in data:
-        item.pop("visitor_name", None)
-    return {"code": 0, "message": "success", "data": data}
+        posts: Dict[int, Optional[Dict[str, Any]]] = {}
+        rows = []
+        for payload in payloads:
+            if payload.post_id not in posts:
+                posts[payload.post_id] = get_post_from_sqlite(sqlite_path, payload.post_id)
+            post = posts[payload.post_id]
+            post_title = str(post["title"] or "") if post else ""
+            post_summary = str(post["summary"] or "") if post else ""
+            rows.append((payload.post_id, post_title, post_summary, payload.content))
+        return success_response(insert_public_comments_to_sqlite(sqlite_path, rows))
+
+    posts_by_id = read_json_index(posts_file)
+    with _JSON_WRITE_LOCK:
+        comments = read_json(comments_file)
+        created_at = _now_local_iso()
+        records = []
+        for payload in payloads:
+            post = posts_by_id.get(payload.post_id, {})
+            records.append(
+                {
+                    "id": allocate_json_id(comments_file, comments),
+                    "post_id": payload.post_id,
+                    "post_title": str(post.get("title", "")),
+                    "post_summary": str(post.get("summary", "")),
+                    "content": payload.content,
+                    "created_at": created_at,
+                }
+            )
+        if records:
+            write_json(comments_file, [*comments, *records])
+    data = [{"id": record["id"], "created_at": created_at} for record in records]
+    return success_response(data)
+
+
+@app.get("/api/v1/comments", response_model=None)
+def list_all_comments(
+    x_admin_password: str | None = Header(default=None), if_none_match: str | None = Header(default=None)
+) -> Response:
+    require_admin_password(x_admin_password)
+    if storage_type == "sqlite":
+        etag = sqlite_etag(sqlite_path)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+        return streaming_success_response(iter_all_comments_from_sqlite(sqlite_path), etag)
+    comments, etag = read_json_versioned(comments_file)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    return with_etag(success_response([_omit(item, "visitor_name") for item in comments]), etag)
 
 
 @app.put("/api/v1/comments/{comment_id}")
 def update_comment(
     comment_id: int, payload: UpdateCommentPayload, x_admin_password: str | None = Header(default=None)
-):
+) -> Response:
     require_admin_password(x_admin_password)
     if storage_type == "sqlite":
         updated = update_comment_in_sqlite(sqlite_path, comment_id, payload)
         if not updated:
-            return {"code": 404, "message": "not found", "data": None}
-        updated.pop("visitor_name", None)
-        return {"code": 0, "message": "success", "data": updated}
-
-    comments = read_json(comments_file)
-    for item in comments:
-        if int(item.get("id", 0)) == comment_id:
-            if payload.content is not None:
-                item["content"] = payload.content
-            item["updated_at"] = _now_local_iso()
-            item.pop("visitor_name", None)
-            write_json(comments_file, comments)
-            return {"code": 0, "message": "success", "data": item}
-    return {"code": 404, "message": "not found", "data": None}
+            return not_found_response()
+        return success_response(updated)
+
+    changes = {**payload.model_dump(exclude_none=True), "updated_at": _now_local_iso()}
+    updated = update_json_record(comments_file, comment_id, changes, omit=("visitor_name",))
+    if updated is None:
+        return not_found_response()
+    return success_response(updated)
 
 
 @app.delete("/api/v1/comments/{comment_id}")
-def delete_comment(comment_id: int, x_admin_password: str | None = Header(default=None)):
+def delete_comment(comment_id: int, x_admin_password: str | None = Header(default=None)) -> Response:
     require_admin_password(x_admin_password)
     if storage_type == "sqlite":
         ok = delete_comment_in_sqlite(sqlite_path, comment_id)
         if not ok:
-            return {"code": 404, "message": "not found", "data": None}
-        return {"code": 0, "message": "success", "data": {"id": comment_id}}
-
-    comments = read_json(comments_file)
-    remaining = [item for item in comments if int(item.get("id", 0)) != comment_id]
-    if len(remaining) == len(comments):
-        return {"code": 404, "message": "not found", "data": None}
-    write_json(comments_file, remaining)
-    return {"code": 0, "message": "success", "data": {"id": comment_id}}
+            return not_found_response()
+        return success_response({"id": comment_id})
+
+    if not remove_json_record(comments_file, comment_id):
+        return not_found_response()
+    return success_response({"id": comment_id})
 
 
 if __name__ == "__main__":
@@ -3,11 +3,16 @@ from __future__ import annotations
 import json
 import os
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 import httpx
 import asyncio
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库 json
+    orjson = None
+
 from src.plugin_system import BaseCommand
 from src.common.logger import get_logger
 from src.common.database.database_model import Messages
@@ -39,12 +44,28 @@ def _safe_int(value: str, default: int = 0) -> int:
         return default
 
 
+def _read_json_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json_file(path: str, data: Any) -> None:
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
 def _load_posts(posts_path: str) -> list:
     if not os.path.exists(posts_path):
         return []
     try:
-        with open(posts_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json_file(posts_path)
         return data if isinstance(data, list) else []
     except Exception:
         return []
@@ -52,8 +73,7 @@ def _load_posts(posts_path: str) -> list:
 
 def _save_posts(posts_path: str, posts: list) -> None:
     os.makedirs(os.path.dirname(posts_path), exist_ok=True)
-    with open(posts_path, "w", encoding="utf-8") as f:
-        json.dump(posts, f, ensure_ascii=False, indent=2)
+    _write_json_file(posts_path, posts)
 
 
 def _normalize_url(url: str) -> str:
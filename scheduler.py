@@ -2,19 +2,35 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import functools
 import hashlib
-import json
 import os
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import pytz
+except ImportError:  # pytz 为可选依赖，未安装时按系统时间处理
+    pytz = None
+
 from src.common.logger import get_logger
 
 from .content_generator import generate_post_from_messages, generate_post_from_topic
-from .publish_command import _load_posts, _save_posts, _safe_int, _publish_remote
+from .publish_command import _load_posts, _save_posts, _safe_int, _publish_remote, _read_json_file, _write_json_file
 
 logger = get_logger("blog_publish_scheduler")
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> Optional[datetime.datetime]:
+    """解析 ISO 时间字符串；队列每轮都会重复解析同一批 publish_at，结果按字符串缓存"""
+    try:
+        if value.endswith("Z"):
+            return datetime.datetime.fromisoformat(value[:-1]).replace(tzinfo=datetime.timezone.utc)
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 class BlogPublishScheduler:
     """
     定时发布调度器
@@ -33,14 +49,12 @@ class BlogPublishScheduler:
 
     def _get_timezone_now(self) -> datetime.datetime:
         timezone_str = self.plugin.get_config("schedule.timezone", "Asia/Shanghai")
+        if pytz is None:
+            self.logger.error("pytz 未安装，使用系统时间")
+            return datetime.datetime.now()
         try:
-            import pytz
-
             tz = pytz.timezone(timezone_str)
             return datetime.datetime.now(tz)
-        except ImportError:
-            self.logger.error("pytz 未安装，使用系统时间")
-            return datetime.datetime.now()
         except Exception as exc:
             self.logger.error(f"时区处理失败: {exc}，使用系统时间")
             return datetime.datetime.now()
@@ -54,8 +68,7 @@ class BlogPublishScheduler:
         if not os.path.exists(path):
             return {}
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _read_json_file(path)
         except Exception:
             return {}
 
@@ -63,8 +76,7 @@ class BlogPublishScheduler:
         """保存任务执行状态"""
         path = self._normalize_path(self.status_path)
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(status, f, ensure_ascii=False, indent=2)
+        _write_json_file(path, status)
 
     def _generate_task_id(self, task: Dict[str, Any]) -> str:
         """生成任务唯一标识"""
@@ -253,6 +265,8 @@ class BlogPublishScheduler:
             return
 
         now = self._get_timezone_now()
+        # 时区只解析一次，整轮队列共用，避免每个条目重复 import/查表
+        tz = self._get_schedule_tz()
         published_count = 0
         remaining: List[Dict[str, Any]] = []
 
@@ -262,7 +276,7 @@ class BlogPublishScheduler:
                 continue
             
             # 检查单条目的 publish_at (如果有)
-            if not self._is_item_due(item, now):
+            if not self._is_item_due(item, now, tz):
                 remaining.append(item)
                 continue
 
@@ -294,8 +308,7 @@ class BlogPublishScheduler:
         if not os.path.exists(queue_path):
             return []
         try:
-            with open(queue_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json_file(queue_path)
             return data if isinstance(data, list) else []
         except Exception as exc:
             self.logger.error(f"读取定时队列失败: {exc}")
@@ -303,31 +316,36 @@ class BlogPublishScheduler:
 
     def _save_queue(self, queue_path: str, items: List[Dict[str, Any]]) -> None:
         os.makedirs(os.path.dirname(queue_path), exist_ok=True)
-        with open(queue_path, "w", encoding="utf-8") as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
+        _write_json_file(queue_path, items)
 
-    def _parse_publish_at(self, value: str) -> Optional[datetime.datetime]:
-        if not value:
+    def _get_schedule_tz(self) -> Any:
+        """解析配置的时区，失败（如未安装 pytz）时返回 None"""
+        timezone_str = self.plugin.get_config("schedule.timezone", "Asia/Shanghai")
+        if pytz is None:
             return None
         try:
-            dt = datetime.datetime.fromisoformat(value)
+            return pytz.timezone(timezone_str)
         except Exception:
             return None
-        if dt.tzinfo is not None:
+
+    def _parse_publish_at(self, value: str, tz: Any) -> Optional[datetime.datetime]:
+        if not value:
+            return None
+        dt = _parse_iso_datetime(value)
+        if dt is None:
+            return None
+        if dt.tzinfo is not None or tz is None:
             return dt
-        timezone_str = self.plugin.get_config("schedule.timezone", "Asia/Shanghai")
         try:
-            import pytz
-            tz = pytz.timezone(timezone_str)
             return tz.localize(dt)
         except Exception:
             return dt
 
-    def _is_item_due(self, item: Dict[str, Any], now: datetime.datetime) -> bool:
+    def _is_item_due(self, item: Dict[str, Any], now: datetime.datetime, tz: Any) -> bool:
         publish_at = item.get("publish_at")
         if not publish_at:
             return True
-        parsed = self._parse_publish_at(str(publish_at))
+        parsed = self._parse_publish_at(str(publish_at), tz)
         if not parsed:
             return True
         return parsed <= now